@@ -4,19 +4,34 @@ A compact 64×64 retro vertical shooter built with Python + Pygame.
 The game updates at a fixed internal resolution and scales up for display.
 """
 
+import functools
 import random
 
+import numpy as np
 import pygame
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; NumPy broadcasting is the fallback
+    njit = None
+
 # Simple 64x64 vertical shooter implemented with PyGame.
 # The game logic runs at an internal 64x64 resolution and is
 # scaled up for display. Comments explain key constants,
 # data structures, and the main game loop.
 
 # --- Strict 64x64 internal resolution ---
-W, H = 64, 64  # internal "real" pixels
-SCALE = 10  # window scale factor (display-only)
+W, H = 64, 64  # internal "real" pixels (also the display mode size;
+# pygame.SCALED lets SDL upscale it to the window on the GPU)
 FPS = 60
+GAME_OVER_FPS = 15  # idle event-polling rate on the game over screen
+
+# Fixed simulation timestep. Game logic always advances in steps of
+# SIM_DT_MS (per-frame speeds and cooldowns assume FPS steps per
+# second) independently of how often a frame is rendered.
+SIM_DT_MS = 1000.0 / FPS
+DT_S = 1.0 / FPS  # the same step in seconds, for timers and rates
+MAX_SIM_STEPS = 5  # catch-up cap per rendered frame
 
 # Sprite / collision sizes (in internal pixels)
 PLAYER_W, PLAYER_H = 3, 3
@@ -66,6 +81,9 @@ SPREAD_DURATION = 60.0  # seconds (strewn / spread ammo)
 # Particle burst settings for pickup feedback
 PARTICLE_COUNT = 10
 PARTICLE_TTL = 0.6  # seconds
+PARTICLE_GRAVITY = 0.02  # px/frame^2 added to particle vy
+# Fading particles are drawn with one of this many brightness levels.
+PARTICLE_ALPHA_LEVELS = 8
 
 # Enemy shooting and difficulty tuning
 # Controls when enemies begin firing, how often they shoot, and
@@ -88,13 +106,71 @@ DROP_WEIGHTS = [
     ("health", 0.10),
 ]  # distribution of drops
 
-
-def clamp(v, lo, hi):
-    """Clamp value v into the inclusive range [lo, hi].
-
-    Used for keeping positions inside the 64x64 playfield.
+# Pickup kinds. All pods share one pool with a kind column; the kind
+# doubles as an index into POD_COLORS.
+POD_KINDS = ("fuel", "ammo", "spread", "health")
+POD_FUEL, POD_AMMO, POD_SPREAD, POD_HEALTH = range(len(POD_KINDS))
+POD_COLORS = (FUEL_COLOR, AMMO_COLOR, SPREAD_COLOR, HP_COLOR)
+# Drop table precomputed once: a kill's kind roll r selects
+# DROP_KIND_IDS[np.searchsorted(DROP_CDF, r, side="right")].
+DROP_KIND_IDS = [POD_KINDS.index(name) for name, _ in DROP_WEIGHTS]
+DROP_CDF = np.cumsum([w for _, w in DROP_WEIGHTS])
+
+# Uniform-grid cell size (pixels) used to bucket enemies for the
+# bullet x enemy collision test (see `_collide_pairs_grid`).
+GRID_CELL = 4
+
+# Entity pool capacities (see `EntityPool`). Every entity kind lives
+# in preallocated NumPy column arrays (structure-of-arrays) with a
+# live count; spawns beyond capacity are dropped.
+MAX_BULLETS = 128
+MAX_ENEMIES = 64
+MAX_ENEMY_BULLETS = 128
+MAX_PODS = 128
+MAX_PARTICLES = 512
+
+
+class Player:
+    """Player ship state.
+
+    A slotted record rather than a dict: fields are fixed-offset
+    attribute loads instead of string-keyed lookups on the hot path,
+    and every field (including powerup timers) exists from the start.
+    Fields:
+     - x,y: integer-ish position in the internal 64x64 world
+     - fire_cd: frames until next allowed shot
+     - lives: remaining lives
+     - hp: ship stability; a life is lost when it reaches zero
+     - fuel / ammo: resource meters
+     - *_time: seconds left on invulnerability and powerups
     """
-    return lo if v < lo else hi if v > hi else v
+
+    __slots__ = (
+        "x",
+        "y",
+        "fire_cd",
+        "lives",
+        "hp",
+        "invuln_time",
+        "fuel",
+        "ammo",
+        "speed_boost_time",
+        "rapid_fire_time",
+        "spread_time",
+    )
+
+    def __init__(self):
+        self.x = W // 2 - 1
+        self.y = H - 10
+        self.fire_cd = 0
+        self.lives = 3
+        self.hp = MAX_HP
+        self.invuln_time = 0.0
+        self.fuel = MAX_FUEL
+        self.ammo = MAX_AMMO
+        self.speed_boost_time = 0.0
+        self.rapid_fire_time = 0.0
+        self.spread_time = 0.0
 
 
 def aabb(ax, ay, aw, ah, bx, by, bw, bh):
@@ -102,77 +178,346 @@ def aabb(ax, ay, aw, ah, bx, by, bw, bh):
 
     Returns True when rectangle A (ax,ay,aw,ah) overlaps
     rectangle B (bx,by,bw,bh). Used for bullets, pickups, and
-    player/enemy collisions.
+    player/enemy collisions. The test is written with `&` so it
+    also works elementwise on NumPy arrays: passing column arrays
+    (or broadcast row/column views) tests many pairs in one call.
+    """
+    return (ax < bx + bw) & (ax + aw > bx) & (ay < by + bh) & (ay + ah > by)
+
+
+def _collide_pairs_grid(bx, by, ex, ey, bw, bh, ew, eh):
+    """Return, for every box at (bx, by), the index of the first box at
+    (ex, ey) it overlaps, or -1 for a miss.
+
+    The (ex, ey) boxes are bucketed into a uniform grid of GRID_CELL
+    pixel cells (a counting sort into `order`), so each bullet only
+    tests the enemies in the few cells its box can reach instead of
+    every enemy. Positions outside the playfield are clamped to the
+    border cells, which keeps the lookup exact. Plain loops: slow in
+    the interpreter but ideal for Numba, which compiles them to native
+    code.
+    """
+    gw = W // GRID_CELL
+    gh = H // GRID_CELL
+    nb = bx.shape[0]
+    ne = ex.shape[0]
+    # Bucket enemies: order[start[c]:start[c + 1]] are the enemies in
+    # cell c, in ascending index order.
+    cells = np.empty(ne, np.int32)
+    start = np.zeros(gw * gh + 1, np.int32)
+    for j in range(ne):
+        cx = min(max(int(np.floor(ex[j] / GRID_CELL)), 0), gw - 1)
+        cy = min(max(int(np.floor(ey[j] / GRID_CELL)), 0), gh - 1)
+        cells[j] = cy * gw + cx
+        start[cells[j] + 1] += 1
+    for c in range(gw * gh):
+        start[c + 1] += start[c]
+    fill = start[:-1].copy()
+    order = np.empty(ne, np.int32)
+    for j in range(ne):
+        order[fill[cells[j]]] = j
+        fill[cells[j]] += 1
+
+    out = np.empty(nb, np.int32)
+    for i in range(nb):
+        # An overlapping enemy's top-left corner lies in
+        # (bx - ew, bx + bw) x (by - eh, by + bh).
+        x0 = min(max(int(np.floor((bx[i] - ew) / GRID_CELL)), 0), gw - 1)
+        x1 = min(max(int(np.floor((bx[i] + bw) / GRID_CELL)), 0), gw - 1)
+        y0 = min(max(int(np.floor((by[i] - eh) / GRID_CELL)), 0), gh - 1)
+        y1 = min(max(int(np.floor((by[i] + bh) / GRID_CELL)), 0), gh - 1)
+        best = -1
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                c = cy * gw + cx
+                for k in range(start[c], start[c + 1]):
+                    j = order[k]
+                    if best >= 0 and j >= best:
+                        break
+                    if (
+                        bx[i] < ex[j] + ew
+                        and bx[i] + bw > ex[j]
+                        and by[i] < ey[j] + eh
+                        and by[i] + bh > ey[j]
+                    ):
+                        best = j
+                        break
+        out[i] = best
+    return out
+
+
+def _collide_pairs_numpy(bx, by, ex, ey, bw, bh, ew, eh):
+    """NumPy fallback for `collide_pairs`: one broadcast AABB matrix."""
+    if ex.shape[0] == 0:
+        return np.full(bx.shape[0], -1, np.int32)
+    hits = aabb(bx[:, None], by[:, None], bw, bh, ex[None, :], ey[None, :], ew, eh)
+    return np.where(hits.any(axis=1), hits.argmax(axis=1), -1).astype(np.int32)
+
+
+def _move_entities(
+    n_bullets,
+    bullets_x,
+    bullets_y,
+    bullets_vx,
+    bullets_vy,
+    n_enemies,
+    enemies_y,
+    enemy_dy,
+    n_enemy_bullets,
+    enemy_bullets_x,
+    enemy_bullets_y,
+    enemy_bullets_vx,
+    enemy_bullets_vy,
+    n_pods,
+    pods_y,
+    pod_dy,
+    n_particles,
+    particles_x,
+    particles_y,
+    particles_vx,
+    particles_vy,
+    particles_ttl,
+):
+    """Advance every entity pool by one simulation step of motion.
+
+    Only slice arithmetic, so the same function runs as plain NumPy
+    or, when Numba is available, as one compiled call per step.
     """
-    return ax < bx + bw and ax + aw > bx and ay < by + bh and ay + ah > by
+    bullets_x[:n_bullets] += bullets_vx[:n_bullets]
+    bullets_y[:n_bullets] += bullets_vy[:n_bullets]
+    enemies_y[:n_enemies] += enemy_dy
+    enemy_bullets_x[:n_enemy_bullets] += enemy_bullets_vx[:n_enemy_bullets]
+    enemy_bullets_y[:n_enemy_bullets] += enemy_bullets_vy[:n_enemy_bullets]
+    pods_y[:n_pods] += pod_dy
+    # Particles drift with a small gravity-like effect and lose TTL.
+    particles_x[:n_particles] += particles_vx[:n_particles]
+    particles_y[:n_particles] += particles_vy[:n_particles]
+    particles_vy[:n_particles] += PARTICLE_GRAVITY
+    particles_ttl[:n_particles] -= DT_S
+
+
+if njit is not None:
+    collide_pairs = njit(cache=True, fastmath=True)(_collide_pairs_grid)
+    move_entities = njit(cache=True, fastmath=True)(_move_entities)
+else:
+    collide_pairs = _collide_pairs_numpy
+    move_entities = _move_entities
+
+
+# Solid-color sprites keyed by (w, h, color); see `sprite`.
+SPRITE_CACHE = {}
+
+
+def sprite(w, h, color):
+    """Return a cached w x h surface filled with `color`.
+
+    Used for the static HUD pieces, which are blitted (in batches
+    where possible) instead of redrawn with `pygame.draw.rect`.
+    Sprites are converted to the display's pixel format, so the
+    display mode must be set before the first call.
+    """
+    surf = SPRITE_CACHE.get((w, h, color))
+    if surf is None:
+        surf = pygame.Surface((w, h)).convert()
+        surf.fill(color)
+        SPRITE_CACHE[(w, h, color)] = surf
+    return surf
+
+
+def splat(pixels, xs, ys, w, h, color):
+    """Fill a w x h box at every integer position (xs[i], ys[i]) of
+    the `pixels3d` array `pixels` with one vectorized assignment.
+
+    `color` is either one RGB triple for all boxes or an array with
+    one RGB row per box. Pixels outside the array are clipped.
+    """
+    ox, oy = np.divmod(np.arange(w * h), h)
+    px = (xs.astype(np.int32)[:, None] + ox).ravel()
+    py = (ys.astype(np.int32)[:, None] + oy).ravel()
+    tw, th = pixels.shape[:2]
+    visible = (px >= 0) & (px < tw) & (py >= 0) & (py < th)
+    color = np.asarray(color, np.uint8)
+    if color.ndim == 2:
+        color = np.repeat(color, w * h, axis=0)[visible]
+    pixels[px[visible], py[visible]] = color
+
+
+class EntityPool:
+    """Fixed-capacity structure-of-arrays storage for one entity kind.
+
+    Every field is a preallocated NumPy column, reachable as the
+    attribute of the same name, and `n` is the live count: slots
+    [0, n) hold the live entities. Spawning writes slot n and cleanup
+    moves the survivors to the front, so nothing is allocated per
+    entity. Spawns beyond capacity are dropped.
+    """
+
+    def __init__(self, capacity, **fields):
+        # fields: column name -> dtype, in the order spawn values
+        # are given
+        self.n = 0
+        self.cols = tuple(np.zeros(capacity, dtype) for dtype in fields.values())
+        for name, col in zip(fields, self.cols):
+            setattr(self, name, col)
+
+    def spawn(self, *values):
+        """Write one entity (one value per column) into slot `n`."""
+        if self.n < len(self.cols[0]):
+            for col, v in zip(self.cols, values):
+                col[self.n] = v
+            self.n += 1
+
+    def spawn_many(self, k, *values):
+        """Write k entities into slots [n, n + k).
+
+        Each value is either a scalar shared by all k entities or an
+        array with one entry per entity.
+        """
+        n = self.n
+        m = min(n + k, len(self.cols[0]))
+        for col, v in zip(self.cols, values):
+            col[n:m] = v if np.isscalar(v) else v[: m - n]
+        self.n = m
+
+    def compact(self, keep):
+        """Keep only the live entities flagged in the boolean mask `keep`.
+
+        Compaction happens in place (`np.compress` writing into the head
+        of each column), so no per-frame lists or index sets are built.
+        """
+        n = self.n
+        m = int(np.count_nonzero(keep))
+        if m < n:
+            for col in self.cols:
+                np.compress(keep, col[:n], axis=0, out=col[:m])
+        self.n = m
 
 
 def main():
     pygame.init()
     pygame.display.set_caption("64x64 Vertical Scrolling Shooter (PyGame)")
 
-    # Window is just a scaled view; the *game* is 64x64.
-    window = pygame.display.set_mode((W * SCALE, H * SCALE))
+    # The display surface itself is 64x64: with SCALED, SDL's renderer
+    # stretches it to the (integer-scaled) window, so no CPU-side
+    # upscaling or extra blit is needed. vsync paces the presents.
+    # This is the only surface we draw onto.
+    screen64 = pygame.display.set_mode(
+        (W, H), pygame.SCALED | pygame.DOUBLEBUF, vsync=1
+    )
     clock = pygame.time.Clock()
 
-    # This is the only surface we draw onto (64x64 RGB).
-    screen64 = pygame.Surface((W, H))  # default is RGB
-
     # Minimal font (rendered onto 64x64 too)
     font = pygame.font.Font(None, 12)
 
+    @functools.lru_cache(maxsize=128)
+    def render_text(text, color):
+        """Render `text` once per (text, color) and reuse the surface;
+        the HUD only changes when score or lives do."""
+        return font.render(text, True, color).convert_alpha()
+
+    # Game over text never changes, so render it once up front.
+    game_over_text = render_text("GAME OVER", (255, 255, 255))
+    game_over_hint = render_text("ESC", (200, 200, 200))
+
+    # Scrolling-star background. The deterministic tiny stars (they
+    # give a sense of vertical motion) repeat every H rows, so they are
+    # drawn once into a strip twice the screen height and each frame
+    # blits the H-row window for the current scroll phase.
+    star_strip = pygame.Surface((W, H * 2)).convert()
+    star_strip.fill((0, 0, 0))
+    for i in range(18):
+        sx = (i * 13 + 7) % W
+        sy = (i * 19) % H
+        star_strip.set_at((sx, sy), (40, 40, 40))
+        star_strip.set_at((sx, sy + H), (40, 40, 40))
+
+    # Pickup colors indexed by kind, for drawing all pods at once.
+    pod_palette = np.array(POD_COLORS, np.uint8)
+
+    # HUD bar layout is fixed: the available width is split into three
+    # bars with small gaps, with powerup timer bars just above them.
+    pad = 2
+    total_w = W - pad * 2
+    gap = 1
+    third_w = (total_w - gap * 2) // 3
+    bar_h = 4
+    b0x = pad
+    b1x = pad + third_w + gap
+    b2x = pad + (third_w + gap) * 2
+    fy = H - bar_h - 1
+    pt_h = 2
+    ty = fy - pt_h - 1
+    bar_track = sprite(third_w, bar_h, (30, 30, 30))
+    bar_tracks = [(bar_track, (bx, fy)) for bx in (b0x, b1x, b2x)]
+    timer_track = sprite(third_w, pt_h, (20, 20, 20))
+
+    # Pre-warm the collision and motion kernels so a Numba compile (or
+    # cache load) happens now rather than mid-game.
+    warm = np.zeros(1, np.float32)
+    collide_pairs(warm, warm, warm, warm, BULLET_W, BULLET_H, ENEMY_W, ENEMY_H)
+    move_entities(
+        0, *[warm] * 4, 0, warm, 0.0, 0, *[warm] * 4, 0, warm, 0.0, 0, *[warm] * 5
+    )
+
     # --- Player state ---
-    # Stored as a dict for simplicity. Keys:
-    #  - x,y: integer-ish position in the internal 64x64 world
-    #  - fire_cd: frames until next allowed shot
-    #  - lives: remaining lives
-    #  - fuel / ammo: resource meters
-    player = {
-        "x": W // 2 - 1,
-        "y": H - 10,
-        "fire_cd": 0,
-        "lives": 3,
-        "hp": MAX_HP,
-        "invuln_time": 0.0,
-        "fuel": MAX_FUEL,
-        "ammo": MAX_AMMO,
-    }
-
-    # --- Entity lists ---
-    # bullets: list of player projectiles
-    # enemies: list of enemy ships
-    # enemy_bullets: enemy projectiles the player must avoid
-    # *_pods: pickup items for fuel/ammo/spread
-    # particles: small visual effects for pickups
-    bullets = []  # dicts: {x,y,vx,vy}
-    enemies = []  # dicts: {x,y,dx}
-    enemy_bullets = []  # dicts: {x,y,vx,vy}
-    fuel_pods = []  # dicts: {x,y,color}
-    ammo_pods = []
-    spread_pods = []
-    health_pods = []
-    particles = []  # dicts: {x,y,vx,vy,color,ttl}
+    player = Player()
+
+    # --- Entity storage (structure-of-arrays, see `EntityPool`) ---
+    #  bullets: player projectiles {x,y,vx,vy}
+    #  enemies: enemy ships {x,y,dx}
+    #  enemy_bullets: enemy projectiles the player must avoid
+    #  pods: pickup items {x,y,kind}; kind is one of POD_FUEL..POD_HEALTH
+    #  particles: small visual effects {x,y,vx,vy,ttl,color}; color
+    #    is an index into `particle_palette`
+    f32 = np.float32
+    bullets = EntityPool(MAX_BULLETS, x=f32, y=f32, vx=f32, vy=f32)
+    enemies = EntityPool(MAX_ENEMIES, x=f32, y=f32, dx=f32)
+    enemy_bullets = EntityPool(MAX_ENEMY_BULLETS, x=f32, y=f32, vx=f32, vy=f32)
+    pods = EntityPool(MAX_PODS, x=f32, y=f32, kind=np.uint8)
+    particles = EntityPool(
+        MAX_PARTICLES, x=f32, y=f32, vx=f32, vy=f32, ttl=f32, color=np.uint8
+    )
     score = 0
     frame = 0
     time_s = 0.0
 
-    blink_color = (255, 255, 255)
-    blink_ttl = 0.12
-    explosion_color = (220, 80, 40)
+    # Batched NumPy RNG for the per-entity rolls (enemy fire, drops,
+    # particle bursts): one call draws the values for a whole group.
+    rng = np.random.default_rng()
 
-    def add_particle(x, y, vx, vy, color, ttl):
-        particles.append(
-            {"x": x, "y": y, "vx": vx, "vy": vy, "color": color, "ttl": ttl}
-        )
+    particle_palette = np.array([(255, 255, 255), (220, 80, 40)], np.uint8)
+    blink_color = 0  # palette index (white)
+    blink_ttl = 0.12
+    explosion_color = 1  # palette index (orange-red)
+    # Faded palette: particle_shades[color, level] is the palette color
+    # at brightness level / PARTICLE_ALPHA_LEVELS, so drawing is a lookup.
+    fade = np.arange(PARTICLE_ALPHA_LEVELS + 1) / PARTICLE_ALPHA_LEVELS
+    particle_shades = (particle_palette[:, None, :] * fade[:, None]).astype(np.uint8)
 
-    def add_blink(x, y):
-        add_particle(x, y, 0.0, 0.0, blink_color, blink_ttl)
+    def add_blinks(xs, ys):
+        # One stationary blink particle per (xs[i], ys[i]), spawned
+        # as a single block.
+        particles.spawn_many(len(xs), xs, ys, 0.0, 0.0, blink_ttl, blink_color)
 
     def add_explosion(x, y):
-        for _ in range(PARTICLE_COUNT):
-            vx = random.uniform(-1.2, 1.2)
-            vy = random.uniform(-1.2, 1.2)
-            add_particle(x, y, vx, vy, explosion_color, PARTICLE_TTL)
+        # Claim a block of free slots at the end of the pool and fill
+        # it with slice writes; velocities come from one batched draw.
+        particles.spawn_many(
+            PARTICLE_COUNT,
+            x,
+            y,
+            rng.uniform(-1.2, 1.2, PARTICLE_COUNT),
+            rng.uniform(-1.2, 1.2, PARTICLE_COUNT),
+            PARTICLE_TTL,
+            explosion_color,
+        )
+
+    def touching_player(xs, ys, w, h):
+        """Return the indices of the w x h entities at (xs, ys) that
+        overlap the player."""
+        return np.flatnonzero(
+            aabb(player.x, player.y, PLAYER_W, PLAYER_H, xs, ys, w, h)
+        )
 
     spawn_interval = 56  # frames (initial, start slower)
     bullet_speed = 2.5  # px/frame upward
@@ -183,165 +528,155 @@ def main():
     running = True
     game_over = False
 
+    accumulator = 0.0  # real time (ms) not yet simulated
+
+    # Key codes bound to locals once so the per-frame input checks
+    # don't look them up as attributes of the `pygame` module.
+    k_left, k_right, k_up, k_down = (
+        pygame.K_LEFT,
+        pygame.K_RIGHT,
+        pygame.K_UP,
+        pygame.K_DOWN,
+    )
+    k_a, k_d, k_w, k_s = pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s
+    k_space, k_escape = pygame.K_SPACE, pygame.K_ESCAPE
+    # Likewise for the random-module helpers called inside the loop.
+    _rand, _randint, _choice = random.random, random.randint, random.choice
+
     while running:
-        dt = clock.tick(FPS)
-        frame += 1
+        if game_over:
+            # The last frame (with the GAME OVER text) is already on
+            # screen and nothing changes any more: idle at a low rate,
+            # only watch for quitting and re-present if the window
+            # contents were lost.
+            clock.tick(GAME_OVER_FPS)
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (
+                    event.type == pygame.KEYDOWN and event.key == k_escape
+                ):
+                    running = False
+                elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWSIZECHANGED):
+                    pygame.display.flip()
+            continue
+
+        accumulator += clock.tick(FPS)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
 
         # `keys` holds current keyboard state. We also accept WASD.
         keys = pygame.key.get_pressed()
-        if keys[pygame.K_ESCAPE]:
+        if keys[k_escape]:
             running = False
         # Compute directional input: left/right and up/down as -1/0/1
-        # Arrow keys or WASD both work.
-        dx = (1 if (keys[pygame.K_RIGHT] or keys[pygame.K_d]) else 0) - (
-            1 if (keys[pygame.K_LEFT] or keys[pygame.K_a]) else 0
-        )
-        dy = (1 if (keys[pygame.K_DOWN] or keys[pygame.K_s]) else 0) - (
-            1 if (keys[pygame.K_UP] or keys[pygame.K_w]) else 0
-        )
-
-        # update elapsed time in seconds (used to scale difficulty)
-        time_s += dt / 1000.0
-
-        # Level-based dynamic difficulty:
-        #  - `level` increments every LEVEL_DURATION seconds.
-        #  - enemy speed increases per level, and within a level
-        #    we interpolate slightly so difficulty ramps smoothly.
-        level = int(time_s // LEVEL_DURATION)
-        time_in_level = time_s - level * LEVEL_DURATION
-        enemy_speed = (
-            enemy_base_speed
-            + level * ENEMY_SPEED_PER_LEVEL
-            + (time_in_level / LEVEL_DURATION) * ENEMY_SPEED_PER_LEVEL
-        )
-        # spawn interval shortens per level (but clamped)
-        spawn_interval = max(
-            20, int(56 - level * 4 - (time_in_level / LEVEL_DURATION) * 2)
-        )
-
-        # Player movement is affected by remaining fuel: less fuel
-        # means slower movement. A temporary speed boost (from
-        # pickups) multiplies the base speed.
-        fuel_ratio = max(0.0, min(1.0, player["fuel"] / MAX_FUEL))
-        player_speed = player_base_speed * (0.4 + 0.6 * fuel_ratio)
-        # temporary speed boost from pickups
-        if player.get("speed_boost_time", 0.0) > 0.0:
-            player_speed *= SPEED_BOOST_MULT
-
-        player["x"] = clamp(player["x"] + dx * player_speed, 0, W - PLAYER_W)
-        player["y"] = clamp(player["y"] + dy * player_speed, 0, H - PLAYER_H)
-
-        if player["fire_cd"] > 0:
-            player["fire_cd"] -= 1
-
-        # Firing consumes ammo. If a rapid-fire powerup is active,
-        # the cooldown between shots is reduced. If a spread powerup
-        # is active, the shot produces three projectiles with slight
-        # horizontal velocities to cover a wider area.
-        if keys[pygame.K_SPACE] and player["fire_cd"] == 0 and player["ammo"] > 0:
-            rapid = player.get("rapid_fire_time", 0.0) > 0.0
-            cooldown = max(
-                1, int(fire_cooldown_frames * (RAPID_FIRE_FACTOR if rapid else 1.0))
+        # (bools subtract as ints). Arrow keys or WASD both work.
+        dx = (keys[k_right] or keys[k_d]) - (keys[k_left] or keys[k_a])
+        dy = (keys[k_down] or keys[k_s]) - (keys[k_up] or keys[k_w])
+
+        # Advance the simulation in fixed SIM_DT_MS steps for all the
+        # time that has accumulated; input sampled above applies to
+        # every step. The step count is capped so a long stall does
+        # not trigger a catch-up spiral, and the world stops on the
+        # step that ends the game.
+        steps = 0
+        while accumulator >= SIM_DT_MS and not game_over:
+            if steps == MAX_SIM_STEPS:
+                accumulator = 0.0
+                break
+            accumulator -= SIM_DT_MS
+            steps += 1
+            frame += 1
+
+            # update elapsed time in seconds (used to scale difficulty)
+            time_s += DT_S
+
+            # Level-based dynamic difficulty:
+            #  - `level` increments every LEVEL_DURATION seconds.
+            #  - enemy speed increases per level, and within a level
+            #    we interpolate slightly so difficulty ramps smoothly.
+            level = int(time_s // LEVEL_DURATION)
+            time_in_level = time_s - level * LEVEL_DURATION
+            enemy_speed = (
+                enemy_base_speed
+                + level * ENEMY_SPEED_PER_LEVEL
+                + (time_in_level / LEVEL_DURATION) * ENEMY_SPEED_PER_LEVEL
             )
-            player["fire_cd"] = cooldown
-            player["ammo"] = max(0, player["ammo"] - 1)
-
-            # Spread shot if active: center + left + right bullets
-            if player.get("spread_time", 0.0) > 0.0:
-                # three bullets with small horizontal velocity
-                bullets.append(
-                    {
-                        "x": float(player["x"] + 1),
-                        "y": float(player["y"] - 2),
-                        "vx": 0.0,
-                        "vy": -bullet_speed,
-                    }
-                )
-                bullets.append(
-                    {
-                        "x": float(player["x"] + 1),
-                        "y": float(player["y"] - 2),
-                        "vx": -0.6,
-                        "vy": -bullet_speed,
-                    }
-                )
-                bullets.append(
-                    {
-                        "x": float(player["x"] + 1),
-                        "y": float(player["y"] - 2),
-                        "vx": 0.6,
-                        "vy": -bullet_speed,
-                    }
-                )
-            else:
-                bullets.append(
-                    {
-                        "x": float(player["x"] + 1),
-                        "y": float(player["y"] - 2),
-                        "vx": 0.0,
-                        "vy": -bullet_speed,
-                    }
-                )
-
-        # Spawn enemies at a regular interval. As `spawn_interval`
-        # decreases over time the game becomes denser/harder.
-        if frame % spawn_interval == 0:
-            enemies.append(
-                {
-                    "x": float(random.randint(0, W - ENEMY_W)),
-                    "y": float(-ENEMY_H),
-                    "dx": random.choice([-1, 0, 1]),  # tiny wiggle
-                }
+            # spawn interval shortens per level (but clamped)
+            spawn_interval = max(
+                20, int(56 - level * 4 - (time_in_level / LEVEL_DURATION) * 2)
             )
 
-        # Occasionally spawn ambient pickups (not from enemy drops).
-        # These are independent of drop-on-kill behavior and make the
-        # game more forgiving.
-        if frame % PICKUP_SPAWN_INTERVAL == 0:
-            r = random.random()
-            # spawn fuel (40%), ammo (40%), or health (20%) ambient pickups
-            if r < 0.4:
-                fuel_pods.append(
-                    {
-                        "x": float(random.randint(0, W - 2)),
-                        "y": float(-2),
-                        "color": FUEL_COLOR,
-                    }
-                )
-            elif r < 0.8:
-                ammo_pods.append(
-                    {
-                        "x": float(random.randint(0, W - 2)),
-                        "y": float(-2),
-                        "color": AMMO_COLOR,
-                    }
+            # Player movement is affected by remaining fuel: less fuel
+            # means slower movement. A temporary speed boost (from
+            # pickups) multiplies the base speed.
+            fuel_ratio = max(0.0, min(1.0, player.fuel / MAX_FUEL))
+            player_speed = player_base_speed * (0.4 + 0.6 * fuel_ratio)
+            # temporary speed boost from pickups
+            if player.speed_boost_time > 0.0:
+                player_speed *= SPEED_BOOST_MULT
+
+            # Move and keep the ship inside the 64x64 playfield (the
+            # clamp is inlined; enemies are clamped with np.clip).
+            x = player.x + dx * player_speed
+            y = player.y + dy * player_speed
+            player.x = 0 if x < 0 else W - PLAYER_W if x > W - PLAYER_W else x
+            player.y = 0 if y < 0 else H - PLAYER_H if y > H - PLAYER_H else y
+
+            if player.fire_cd > 0:
+                player.fire_cd -= 1
+
+            # Firing consumes ammo. If a rapid-fire powerup is active,
+            # the cooldown between shots is reduced. If a spread powerup
+            # is active, the shot produces three projectiles with slight
+            # horizontal velocities to cover a wider area.
+            if keys[k_space] and player.fire_cd == 0 and player.ammo > 0:
+                rapid = player.rapid_fire_time > 0.0
+                cooldown = max(
+                    1, int(fire_cooldown_frames * (RAPID_FIRE_FACTOR if rapid else 1.0))
                 )
-            else:
-                health_pods.append(
-                    {
-                        "x": float(random.randint(0, W - 2)),
-                        "y": float(-2),
-                        "color": HP_COLOR,
-                    }
+                player.fire_cd = cooldown
+                player.ammo = max(0, player.ammo - 1)
+
+                # Spread shot if active: center + left + right bullets
+                # (three bullets with small horizontal velocity)
+                if player.spread_time > 0.0:
+                    shot_vxs = (0.0, -0.6, 0.6)
+                else:
+                    shot_vxs = (0.0,)
+                for vx in shot_vxs:
+                    bullets.spawn(player.x + 1, player.y - 2, vx, -bullet_speed)
+
+            # Spawn enemies at a regular interval. As `spawn_interval`
+            # decreases over time the game becomes denser/harder.
+            if frame % spawn_interval == 0:
+                enemies.spawn(
+                    _randint(0, W - ENEMY_W),
+                    -ENEMY_H,
+                    _choice([-1, 0, 1]),  # tiny wiggle
                 )
 
-        # Update player bullets: apply velocity vector (vx,vy).
-        # Most bullets go straight up (-vy). Some powerups add vx.
-        for b in bullets:
-            b["x"] += b.get("vx", 0.0)
-            b["y"] += b.get("vy", -bullet_speed)
-
-        # Move enemies (scrolling)
-        for e in enemies:
-            e["y"] += enemy_speed
-            # small horizontal wiggle every few frames
+            # Occasionally spawn ambient pickups (not from enemy drops).
+            # These are independent of drop-on-kill behavior and make the
+            # game more forgiving.
+            if frame % PICKUP_SPAWN_INTERVAL == 0:
+                r = _rand()
+                # spawn fuel (40%), ammo (40%), or health (20%) ambient pickups
+                kind = POD_FUEL if r < 0.4 else POD_AMMO if r < 0.8 else POD_HEALTH
+                pods.spawn(_randint(0, W - 2), -2, kind)
+
+            # Enemies: small horizontal wiggle every few frames (their
+            # scrolling is part of `move_entities` below)
             if frame % 10 == 0:
-                e["x"] = clamp(e["x"] + e["dx"], 0, W - ENEMY_W)
-                if random.random() < 0.2:
-                    e["dx"] = random.choice([-1, 0, 1])
+                np.clip(
+                    enemies.x[: enemies.n] + enemies.dx[: enemies.n],
+                    0,
+                    W - ENEMY_W,
+                    out=enemies.x[: enemies.n],
+                )
+                # each enemy rerolls its wiggle with 20% chance; all the
+                # rolls and new directions come from batched draws
+                reroll = np.flatnonzero(rng.random(enemies.n) < 0.2)
+                enemies.dx[reroll] = rng.integers(-1, 2, len(reroll))
 
             # Enemy shooting (only after a while)
             # Enemies fire occasional bullets aimed roughly at the
@@ -349,403 +684,318 @@ def main():
             # simple and occasionally misses to keep gameplay fair.
             if time_s >= ENEMY_SHOOT_START_TIME:
                 # chance to shoot scaled by current level (predictable
-                # difficulty steps). We keep the probability per frame
-                # proportional to `dt` so framerate changes don't affect
-                # firing frequency.
-                shoot_prob = ENEMY_FIRE_RATE * (1.0 + level * 0.12) * (dt / 1000.0)
-                if random.random() < shoot_prob:
+                # difficulty steps). The probability per step is
+                # proportional to the step length DT_S, so the firing
+                # frequency is per second of game time.
+                shoot_prob = ENEMY_FIRE_RATE * (1.0 + level * 0.12) * DT_S
+                # shoot_prob is tiny, so the number of shots this step is
+                # Poisson with mean shoot_prob * enemies.n; draw the count
+                # and then pick that many distinct shooters.
+                shots = min(rng.poisson(shoot_prob * enemies.n), enemies.n)
+                if shots:
+                    shooters = rng.choice(enemies.n, shots, replace=False)
                     # aim roughly towards player's current x (with small
                     # inaccuracy)
-                    ex = e["x"] + ENEMY_W // 2
-                    ey = e["y"] + ENEMY_H
-                    vx = (player["x"] + PLAYER_W // 2 - ex) * 0.05 + random.uniform(
-                        -0.2, 0.2
+                    ex = enemies.x[shooters] + ENEMY_W // 2
+                    ey = enemies.y[shooters] + ENEMY_H
+                    vx = (player.x + PLAYER_W // 2 - ex) * 0.05 + rng.uniform(
+                        -0.2, 0.2, len(shooters)
                     )
-                    enemy_bullets.append(
-                        {
-                            "x": float(ex),
-                            "y": float(ey),
-                            "vx": vx,
-                            "vy": ENEMY_BULLET_SPEED,
-                        }
+                    enemy_bullets.spawn_many(
+                        len(shooters), ex, ey, vx, ENEMY_BULLET_SPEED
                     )
 
-        # Move enemy bullets
-        for eb in enemy_bullets:
-            eb["x"] += eb.get("vx", 0.0)
-            eb["y"] += eb.get("vy", ENEMY_BULLET_SPEED)
-
-        # Move pickups
-        pickup_dy = PICKUP_SPEED + enemy_speed * 0.2
-        for pods in (fuel_pods, ammo_pods, spread_pods, health_pods):
-            for p in pods:
-                p["y"] += pickup_dy
-
-        # Bullet-enemy collisions: check every player bullet against
-        # every enemy. On hit, mark both for removal and increase score.
-        # There's also a chance the killed enemy will drop a pickup.
-        dead_bullets = set()
-        dead_enemies = set()
-        for bi, b in enumerate(bullets):
-            for ei, e in enumerate(enemies):
-                if aabb(
-                    b["x"],
-                    b["y"],
+            # Move everything in one call: player bullets by their
+            # velocity (most go straight up, spread shots add vx), enemies
+            # and pickups scroll down, enemy bullets fly, particles drift.
+            move_entities(
+                bullets.n,
+                bullets.x,
+                bullets.y,
+                bullets.vx,
+                bullets.vy,
+                enemies.n,
+                enemies.y,
+                enemy_speed,
+                enemy_bullets.n,
+                enemy_bullets.x,
+                enemy_bullets.y,
+                enemy_bullets.vx,
+                enemy_bullets.vy,
+                pods.n,
+                pods.y,
+                PICKUP_SPEED + enemy_speed * 0.2,
+                particles.n,
+                particles.x,
+                particles.y,
+                particles.vx,
+                particles.vy,
+                particles.ttl,
+            )
+
+            # Bullet-enemy collisions: `collide_pairs` tests every player
+            # bullet against every enemy and returns the first enemy each
+            # bullet overlaps (-1 for a miss). Each hitting bullet kills
+            # that enemy and increases score. There's also a chance the
+            # killed enemy will drop a pickup.
+            dead_bullets = np.zeros(bullets.n, bool)
+            dead_enemies = np.zeros(enemies.n, bool)
+            if bullets.n and enemies.n:
+                hit_enemy = collide_pairs(
+                    bullets.x[: bullets.n],
+                    bullets.y[: bullets.n],
+                    enemies.x[: enemies.n],
+                    enemies.y[: enemies.n],
                     BULLET_W,
                     BULLET_H,
-                    e["x"],
-                    e["y"],
                     ENEMY_W,
                     ENEMY_H,
+                )
+                dead_bullets = hit_enemy >= 0
+                hit_enemies = hit_enemy[dead_bullets]
+                dead_enemies[hit_enemies] = True
+                # Chance to drop a pickup when an enemy dies; the rolls for
+                # every kill this frame are drawn in one batch and the
+                # drop kinds looked up in the precomputed CDF in one call.
+                drop_rolls = rng.random(len(hit_enemies)).tolist()
+                drop_slots = np.searchsorted(
+                    DROP_CDF, rng.random(len(hit_enemies)), side="right"
+                ).tolist()
+                for ei, drop_r, slot in zip(
+                    hit_enemies.tolist(), drop_rolls, drop_slots
                 ):
-                    dead_bullets.add(bi)
-                    dead_enemies.add(ei)
+                    ex = float(enemies.x[ei])
+                    ey = float(enemies.y[ei])
                     score += 1
-                    add_explosion(e["x"], e["y"])
-                    # Chance to drop a pickup when an enemy dies.
-                    if random.random() < DROP_CHANCE_PER_KILL:
-                        r = random.random()
-                        cum = 0.0
-                        for name, w in DROP_WEIGHTS:
-                            cum += w
-                            if r < cum:
-                                if name == "fuel":
-                                    fuel_pods.append(
-                                        {
-                                            "x": float(e["x"]),
-                                            "y": float(e["y"]),
-                                            "color": FUEL_COLOR,
-                                        }
-                                    )
-                                elif name == "ammo":
-                                    ammo_pods.append(
-                                        {
-                                            "x": float(e["x"]),
-                                            "y": float(e["y"]),
-                                            "color": AMMO_COLOR,
-                                        }
-                                    )
-                                elif name == "spread":
-                                    spread_pods.append(
-                                        {
-                                            "x": float(e["x"]),
-                                            "y": float(e["y"]),
-                                            "color": SPREAD_COLOR,
-                                        }
-                                    )
-                                elif name == "health":
-                                    health_pods.append(
-                                        {
-                                            "x": float(e["x"]),
-                                            "y": float(e["y"]),
-                                            "color": HP_COLOR,
-                                        }
-                                    )
-                                break
-                    break
-
-        # Player-enemy collisions: touching an enemy costs a life
-        # and resets the player to a starting position. This is a
-        # simple penalty: reduce HP first. If HP depletes the player
-        # loses one life and HP is reset. This keeps `lives` as a
-        # discrete resource while allowing partial damage.
-        for ei, e in enumerate(enemies):
-            # ignore collisions if player is briefly invulnerable
-            if player.get("invuln_time", 0.0) > 0.0:
-                continue
-            if aabb(
-                player["x"],
-                player["y"],
-                PLAYER_W,
-                PLAYER_H,
-                e["x"],
-                e["y"],
-                ENEMY_W,
-                ENEMY_H,
-            ):
-                dead_enemies.add(ei)
-                player["hp"] = max(0, player.get("hp", MAX_HP) - DAMAGE_ENEMY_COLLIDE)
-                # brief invulnerability so multiple hits in the same
-                # frame don't cause multiple life losses
-                player["invuln_time"] = SHORT_HIT_INVULN
-                if player["hp"] <= 0:
-                    player["lives"] -= 1
-                    player["hp"] = MAX_HP
-                    player["x"] = W // 2 - 1
-                    player["y"] = H - 10
-                    # grant longer invuln after losing a life
-                    player["invuln_time"] = INVULN_DURATION
-                    if player["lives"] <= 0:
-                        game_over = True
-                break
-
-        # Enemy bullet -> player collision: simple point-sized bullets
-        # damage the player in the same way as touching an enemy.
-        dead_enemy_bullets = set()
-        for bi, eb in enumerate(enemy_bullets):
+                    add_explosion(ex, ey)
+                    if drop_r < DROP_CHANCE_PER_KILL and slot < len(DROP_KIND_IDS):
+                        kind = DROP_KIND_IDS[slot]
+                        pods.spawn(ex, ey, kind)
+
+            # Player-enemy collisions: touching an enemy costs a life
+            # and resets the player to a starting position. This is a
+            # simple penalty: reduce HP first. If HP depletes the player
+            # loses one life and HP is reset. This keeps `lives` as a
+            # discrete resource while allowing partial damage.
+            # Collisions are ignored while the player is briefly
+            # invulnerable; only the first touching enemy counts.
+            if player.invuln_time <= 0.0 and enemies.n:
+                touching = touching_player(
+                    enemies.x[: enemies.n], enemies.y[: enemies.n], ENEMY_W, ENEMY_H
+                )
+                if len(touching):
+                    dead_enemies[touching[0]] = True
+                    player.hp = max(0, player.hp - DAMAGE_ENEMY_COLLIDE)
+                    # brief invulnerability so multiple hits in the same
+                    # frame don't cause multiple life losses
+                    player.invuln_time = SHORT_HIT_INVULN
+                    if player.hp <= 0:
+                        player.lives -= 1
+                        player.hp = MAX_HP
+                        player.x = W // 2 - 1
+                        player.y = H - 10
+                        # grant longer invuln after losing a life
+                        player.invuln_time = INVULN_DURATION
+                        if player.lives <= 0:
+                            game_over = True
+
+            # Enemy bullet -> player collision: simple point-sized bullets
+            # damage the player in the same way as touching an enemy.
+            dead_enemy_bullets = np.zeros(enemy_bullets.n, bool)
             # ignore if invulnerable
-            if player.get("invuln_time", 0.0) > 0.0:
-                continue
-            if aabb(
-                player["x"], player["y"], PLAYER_W, PLAYER_H, eb["x"], eb["y"], 1, 1
-            ):
-                dead_enemy_bullets.add(bi)
-                player["hp"] = max(0, player.get("hp", MAX_HP) - DAMAGE_ENEMY_BULLET)
-                # short invuln after getting hit
-                player["invuln_time"] = SHORT_HIT_INVULN
-                if player["hp"] <= 0:
-                    player["lives"] -= 1
-                    player["hp"] = MAX_HP
-                    player["x"] = W // 2 - 1
-                    player["y"] = H - 10
-                    # longer invuln after losing a life
-                    player["invuln_time"] = INVULN_DURATION
-                    if player["lives"] <= 0:
-                        game_over = True
-        enemy_bullets = [
-            eb
-            for i, eb in enumerate(enemy_bullets)
-            if i not in dead_enemy_bullets and eb["y"] < H + 2
-        ]
-
-        # Player-pickup collisions: apply effect and show a short blink.
-        dead_fuel = set()
-        for pi, p in enumerate(fuel_pods):
-            if aabb(player["x"], player["y"], PLAYER_W, PLAYER_H, p["x"], p["y"], 2, 2):
-                # refill partially and give a temporary speed boost
-                player["fuel"] = min(MAX_FUEL, player["fuel"] + FUEL_PICKUP_AMOUNT)
-                player.setdefault("speed_boost_time", 0.0)
-                player["speed_boost_time"] = SPEED_BOOST_DURATION
-                score += 0  # could add pickup points
-                add_blink(p["x"], p["y"])
-                dead_fuel.add(pi)
-        fuel_pods = [p for i, p in enumerate(fuel_pods) if i not in dead_fuel]
-
-        dead_ammo = set()
-        for pi, p in enumerate(ammo_pods):
-            if aabb(player["x"], player["y"], PLAYER_W, PLAYER_H, p["x"], p["y"], 2, 2):
-                # refill partially and give a temporary rapid-fire
-                player["ammo"] = min(MAX_AMMO, player["ammo"] + AMMO_PICKUP_AMOUNT)
-                player.setdefault("rapid_fire_time", 0.0)
-                player["rapid_fire_time"] = RAPID_FIRE_DURATION
-                score += 0
-                add_blink(p["x"], p["y"])
-                dead_ammo.add(pi)
-        ammo_pods = [p for i, p in enumerate(ammo_pods) if i not in dead_ammo]
-
-        dead_spread = set()
-        for pi, p in enumerate(spread_pods):
-            if aabb(player["x"], player["y"], PLAYER_W, PLAYER_H, p["x"], p["y"], 2, 2):
-                # grant spread (strewn / spread ammo) for a duration
-                player.setdefault("spread_time", 0.0)
-                player["spread_time"] = SPREAD_DURATION
-                score += 0
-                add_blink(p["x"], p["y"])
-                dead_spread.add(pi)
-        spread_pods = [p for i, p in enumerate(spread_pods) if i not in dead_spread]
-
-        # Health pickups restore a chunk of HP up to MAX_HP.
-        dead_health = set()
-        for pi, p in enumerate(health_pods):
-            if aabb(player["x"], player["y"], PLAYER_W, PLAYER_H, p["x"], p["y"], 2, 2):
-                player["hp"] = min(
-                    MAX_HP, player.get("hp", MAX_HP) + HEALTH_PICKUP_AMOUNT
+            if player.invuln_time <= 0.0 and enemy_bullets.n:
+                hit = touching_player(
+                    enemy_bullets.x[: enemy_bullets.n],
+                    enemy_bullets.y[: enemy_bullets.n],
+                    1,
+                    1,
                 )
-                score += 0
-                add_blink(p["x"], p["y"])
-                dead_health.add(pi)
-        health_pods = [p for i, p in enumerate(health_pods) if i not in dead_health]
-
-        # Cleanup offscreen
-        bullets = [
-            b
-            for i, b in enumerate(bullets)
-            if i not in dead_bullets and b["y"] > -BULLET_H
-        ]
-        enemies = [
-            e
-            for i, e in enumerate(enemies)
-            if i not in dead_enemies and e["y"] < H + ENEMY_H
-        ]
-        fuel_pods = [p for p in fuel_pods if p["y"] < H + 2]
-        ammo_pods = [p for p in ammo_pods if p["y"] < H + 2]
-        spread_pods = [p for p in spread_pods if p["y"] < H + 2]
-        health_pods = [p for p in health_pods if p["y"] < H + 2]
-
-        # Move particles and cleanup
-        # Particles are purely visual and have a TTL (time-to-live).
-        # They drift with a small gravity-like effect for flair.
-        new_particles = []
-        for part in particles:
-            part["x"] += part["vx"]
-            part["y"] += part["vy"]
-            part["vy"] += 0.02  # gravity-ish
-            part["ttl"] -= dt / 1000.0
-            if part["ttl"] > 0:
-                new_particles.append(part)
-        particles[:] = new_particles
-
-        # Consume fuel over time
-        player["fuel"] = max(
-            0.0, player["fuel"] - FUEL_CONSUMPTION_PER_SEC * (dt / 1000.0)
-        )
-
-        # Update powerup timers
-        if player.get("rapid_fire_time", 0.0) > 0.0:
-            player["rapid_fire_time"] = max(
-                0.0, player["rapid_fire_time"] - dt / 1000.0
-            )
-        if player.get("speed_boost_time", 0.0) > 0.0:
-            player["speed_boost_time"] = max(
-                0.0, player["speed_boost_time"] - dt / 1000.0
+                if len(hit):
+                    dead_enemy_bullets[hit[0]] = True
+                    player.hp = max(0, player.hp - DAMAGE_ENEMY_BULLET)
+                    # short invuln after getting hit
+                    player.invuln_time = SHORT_HIT_INVULN
+                    if player.hp <= 0:
+                        player.lives -= 1
+                        player.hp = MAX_HP
+                        player.x = W // 2 - 1
+                        player.y = H - 10
+                        # longer invuln after losing a life
+                        player.invuln_time = INVULN_DURATION
+                        if player.lives <= 0:
+                            game_over = True
+
+            # Player-pickup collisions: apply effect and show a short blink.
+            # One pass over the shared pool; the effect is chosen by kind.
+            hit = touching_player(pods.x[: pods.n], pods.y[: pods.n], 2, 2)
+            for kind in pods.kind[hit].tolist():
+                if kind == POD_FUEL:
+                    # refill partially and give a temporary speed boost
+                    player.fuel = min(MAX_FUEL, player.fuel + FUEL_PICKUP_AMOUNT)
+                    player.speed_boost_time = SPEED_BOOST_DURATION
+                elif kind == POD_AMMO:
+                    # refill partially and give a temporary rapid-fire
+                    player.ammo = min(MAX_AMMO, player.ammo + AMMO_PICKUP_AMOUNT)
+                    player.rapid_fire_time = RAPID_FIRE_DURATION
+                elif kind == POD_SPREAD:
+                    # grant spread (strewn / spread ammo) for a duration
+                    player.spread_time = SPREAD_DURATION
+                else:
+                    # Health pickups restore a chunk of HP up to MAX_HP.
+                    player.hp = min(MAX_HP, player.hp + HEALTH_PICKUP_AMOUNT)
+                score += 0  # could add pickup points
+            add_blinks(pods.x[hit], pods.y[hit])
+            dead_pods = np.zeros(pods.n, bool)
+            dead_pods[hit] = True
+
+            # Cleanup: one in-place compaction per pool at the end of the
+            # frame drops dead, collected, expired and offscreen entities.
+            bullets.compact(~dead_bullets & (bullets.y[: bullets.n] > -BULLET_H))
+            enemies.compact(~dead_enemies & (enemies.y[: enemies.n] < H + ENEMY_H))
+            enemy_bullets.compact(
+                ~dead_enemy_bullets & (enemy_bullets.y[: enemy_bullets.n] < H + 2)
             )
-        if player.get("spread_time", 0.0) > 0.0:
-            player["spread_time"] = max(0.0, player["spread_time"] - dt / 1000.0)
-        if player.get("invuln_time", 0.0) > 0.0:
-            player["invuln_time"] = max(0.0, player["invuln_time"] - dt / 1000.0)
+            pods.compact(~dead_pods & (pods.y[: pods.n] < H + 2))
+            particles.compact(particles.ttl[: particles.n] > 0)
+
+            # Consume fuel over time
+            player.fuel = max(0.0, player.fuel - FUEL_CONSUMPTION_PER_SEC * DT_S)
+
+            # Update powerup timers (a timer at 0.0 stays at 0.0)
+            player.rapid_fire_time = max(0.0, player.rapid_fire_time - DT_S)
+            player.speed_boost_time = max(0.0, player.speed_boost_time - DT_S)
+            player.spread_time = max(0.0, player.spread_time - DT_S)
+            player.invuln_time = max(0.0, player.invuln_time - DT_S)
+
+        # Render only when the simulation produced a new state.
+        if not steps:
+            continue
 
         # --- Render (ONLY onto 64x64) ---
         # All drawing happens on the 64x64 surface and then is
         # scaled up to the window size. Keep rendering cheap and
         # avoid anti-aliasing to preserve the pixel aesthetic.
-        # Simple scrolling-star background (still 64x64)
-        screen64.fill((0, 0, 0))
-        # deterministic tiny stars (gives a sense of vertical motion)
-        for i in range(18):
-            sx = (i * 13 + 7) % W
-            sy = (i * 19 + frame) % H
-            screen64.set_at((sx, sy), (40, 40, 40))
-
-        # Draw player bullets (white). Use integer positions to avoid
-        # blurring when scaling up.
-        for b in bullets:
-            pygame.draw.rect(
-                screen64,
-                (255, 255, 255),
-                (int(b["x"]), int(b["y"]), BULLET_W, BULLET_H),
-            )
+        # Simple scrolling-star background (still 64x64): one blit of
+        # the star strip window for this scroll phase clears the screen
+        # and draws the stars.
+        screen64.blit(star_strip, (0, 0), (0, -frame % H, W, H))
+
+        # All entities are written straight into the surface's pixel
+        # buffer: `pixels3d` locks the surface once and each layer is
+        # one vectorized NumPy assignment (see `splat`) instead of a
+        # draw call or blit per entity. Positions are truncated to
+        # integers to avoid blurring when scaling up. The view must be
+        # released before the next blit.
+        pixels = pygame.surfarray.pixels3d(screen64)
+
+        # Draw player bullets (white)
+        splat(
+            pixels,
+            bullets.x[: bullets.n],
+            bullets.y[: bullets.n],
+            BULLET_W,
+            BULLET_H,
+            (255, 255, 255),
+        )
 
         # Draw enemies (red)
-        for e in enemies:
-            pygame.draw.rect(
-                screen64, (220, 60, 60), (int(e["x"]), int(e["y"]), ENEMY_W, ENEMY_H)
-            )
+        splat(
+            pixels,
+            enemies.x[: enemies.n],
+            enemies.y[: enemies.n],
+            ENEMY_W,
+            ENEMY_H,
+            (220, 60, 60),
+        )
 
         # Draw enemy bullets (smaller, orange)
-        for eb in enemy_bullets:
-            pygame.draw.rect(
-                screen64, (240, 140, 80), (int(eb["x"]), int(eb["y"]), 1, 1)
-            )
+        splat(
+            pixels,
+            enemy_bullets.x[: enemy_bullets.n],
+            enemy_bullets.y[: enemy_bullets.n],
+            1,
+            1,
+            (240, 140, 80),
+        )
 
         # Draw player (cyan). If invulnerable, flicker to indicate state.
         draw_player_visible = True
-        if player.get("invuln_time", 0.0) > 0.0:
+        if player.invuln_time > 0.0:
             # simple time-based flicker (no extra state needed)
             if int(time_s * 10) % 2 == 0:
                 draw_player_visible = False
         if draw_player_visible:
-            pygame.draw.rect(
-                screen64,
-                (60, 220, 220),
-                (int(player["x"]), int(player["y"]), PLAYER_W, PLAYER_H),
-            )
-
-        # Draw particles (on top). We fade them by multiplying RGB by
-        # alpha derived from remaining TTL.
-        for part in particles:
-            alpha = max(0.0, part["ttl"] / PARTICLE_TTL)
-            c = part["color"]
-            col = (int(c[0] * alpha), int(c[1] * alpha), int(c[2] * alpha))
-            px = int(part["x"])
-            py = int(part["y"])
-            if 0 <= px < W and 0 <= py < H:
-                screen64.set_at((px, py), col)
-
-        # Draw pickups — small 2x2 colored squares.
-        for pods in (fuel_pods, ammo_pods, spread_pods, health_pods):
-            for p in pods:
-                pygame.draw.rect(
-                    screen64,
-                    p["color"],
-                    (int(p["x"]), int(p["y"]), 2, 2),
-                )
-
-        # HUD (tiny)
+            x, y = int(player.x), int(player.y)
+            pixels[x : x + PLAYER_W, y : y + PLAYER_H] = (60, 220, 220)
+
+        # Draw particles (on top). Remaining TTL is rounded to a few
+        # brightness levels that index the precomputed faded palette.
+        levels = np.rint(
+            particles.ttl[: particles.n] * (PARTICLE_ALPHA_LEVELS / PARTICLE_TTL)
+        ).astype(np.int32)
+        np.minimum(levels, PARTICLE_ALPHA_LEVELS, out=levels)
+        px = particles.x[: particles.n].astype(np.int32)
+        py = particles.y[: particles.n].astype(np.int32)
+        # Cull particles outside the canvas and those faded to level 0
+        # (pure black on the black background).
+        visible = (px >= 0) & (px < W) & (py >= 0) & (py < H) & (levels > 0)
+        colors = particle_shades[
+            particles.color[: particles.n][visible], levels[visible]
+        ]
+        pixels[px[visible], py[visible]] = colors
+
+        # Draw pickups — small 2x2 squares colored by kind.
+        splat(
+            pixels,
+            pods.x[: pods.n],
+            pods.y[: pods.n],
+            2,
+            2,
+            pod_palette[pods.kind[: pods.n]],
+        )
+        del pixels  # unlock the surface
 
         # HUD (tiny): score and lives at top-left
-        hud = font.render(f"{score}  L{player['lives']}", True, (200, 200, 200))
+        hud = render_text(f"{score}  L{player.lives}", (200, 200, 200))
         screen64.blit(hud, (1, 1))
 
-        # Resource bars at bottom. We split the available width into three
-        # bars with small gaps.
-        pad = 2
-        total_w = W - pad * 2
-        gap = 1
-        third_w = (total_w - gap * 2) // 3
-        bar_h = 4
-        # positions for three bars
-        b0x = pad
-        b1x = pad + third_w + gap
-        b2x = pad + (third_w + gap) * 2
-        fy = H - bar_h - 1
-
         # Resource bars at bottom: Ammo (left), Fuel (center), Health (right).
         # Order requested: Munition (Ammo), Treibstoff (Fuel), Gesundheit (Health).
-        # Ammo (left)
-        pygame.draw.rect(screen64, (30, 30, 30), (b0x, fy, third_w, bar_h))
-        ammo_w = int(third_w * (player["ammo"] / MAX_AMMO))
-        pygame.draw.rect(screen64, AMMO_COLOR, (b0x, fy, ammo_w, bar_h))
-
-        # Fuel (center)
-        pygame.draw.rect(screen64, (30, 30, 30), (b1x, fy, third_w, bar_h))
-        fuel_w = int(third_w * (player["fuel"] / MAX_FUEL))
-        pygame.draw.rect(screen64, FUEL_COLOR, (b1x, fy, fuel_w, bar_h))
-
-        # Health (right)
-        pygame.draw.rect(screen64, (30, 30, 30), (b2x, fy, third_w, bar_h))
-        hp_w = int(third_w * (player.get("hp", MAX_HP) / MAX_HP))
-        pygame.draw.rect(screen64, HP_COLOR, (b2x, fy, hp_w, bar_h))
+        # The dark tracks go out in one batched blit; the levels are fills.
+        screen64.blits(bar_tracks, doreturn=False)
+        ammo_w = int(third_w * (player.ammo / MAX_AMMO))
+        screen64.fill(AMMO_COLOR, (b0x, fy, ammo_w, bar_h))
+        fuel_w = int(third_w * (player.fuel / MAX_FUEL))
+        screen64.fill(FUEL_COLOR, (b1x, fy, fuel_w, bar_h))
+        hp_w = int(third_w * (player.hp / MAX_HP))
+        screen64.fill(HP_COLOR, (b2x, fy, hp_w, bar_h))
 
         # Powerup timers (small bars above corresponding resource bars)
         # Show remaining duration for active temporary effects.
-        tpad = 1
-        pt_h = 2
         # Powerup timers aligned with the new bar order:
         # - Rapid-fire above Ammo (left), Speed-boost above Fuel (center), Spread above Health (right).
-        if player.get("rapid_fire_time", 0.0) > 0.0:
-            pct = player["rapid_fire_time"] / RAPID_FIRE_DURATION
-            w = int(third_w * pct)
-            pygame.draw.rect(
-                screen64, (20, 20, 20), (b0x, fy - pt_h - tpad, third_w, pt_h)
-            )
-            pygame.draw.rect(screen64, AMMO_COLOR, (b0x, fy - pt_h - tpad, w, pt_h))
-        if player.get("speed_boost_time", 0.0) > 0.0:
-            pct = player["speed_boost_time"] / SPEED_BOOST_DURATION
-            w = int(third_w * pct)
-            pygame.draw.rect(
-                screen64, (20, 20, 20), (b1x, fy - pt_h - tpad, third_w, pt_h)
-            )
-            pygame.draw.rect(screen64, FUEL_COLOR, (b1x, fy - pt_h - tpad, w, pt_h))
-        if player.get("spread_time", 0.0) > 0.0:
-            pct = player["spread_time"] / SPREAD_DURATION
-            w = int(third_w * pct)
-            pygame.draw.rect(
-                screen64, (20, 20, 20), (b2x, fy - pt_h - tpad, third_w, pt_h)
-            )
-            pygame.draw.rect(screen64, SPREAD_COLOR, (b2x, fy - pt_h - tpad, w, pt_h))
+        if player.rapid_fire_time > 0.0:
+            pct = player.rapid_fire_time / RAPID_FIRE_DURATION
+            screen64.blit(timer_track, (b0x, ty))
+            screen64.fill(AMMO_COLOR, (b0x, ty, int(third_w * pct), pt_h))
+        if player.speed_boost_time > 0.0:
+            pct = player.speed_boost_time / SPEED_BOOST_DURATION
+            screen64.blit(timer_track, (b1x, ty))
+            screen64.fill(FUEL_COLOR, (b1x, ty, int(third_w * pct), pt_h))
+        if player.spread_time > 0.0:
+            pct = player.spread_time / SPREAD_DURATION
+            screen64.blit(timer_track, (b2x, ty))
+            screen64.fill(SPREAD_COLOR, (b2x, ty, int(third_w * pct), pt_h))
 
         # Game over text shown in the center when lives hit zero
         if game_over:
-            t1 = font.render("GAME OVER", True, (255, 255, 255))
-            t2 = font.render("ESC", True, (200, 200, 200))
+            t1 = game_over_text
+            t2 = game_over_hint
             screen64.blit(t1, (W // 2 - t1.get_width() // 2, H // 2 - 6))
             screen64.blit(t2, (W // 2 - t2.get_width() // 2, H // 2 + 4))
 
-        # --- Present: scale up without adding new detail ---
-        # Scale the 64x64 surface using pygame's transform and blit to
-        # the real display. This preserves the low-resolution look.
-        scaled = pygame.transform.scale(screen64, (W * SCALE, H * SCALE))
-        window.blit(scaled, (0, 0))
+        # --- Present: SDL scales the 64x64 display surface up without
+        # adding new detail, preserving the low-resolution look.
         pygame.display.flip()
 
     pygame.quit()